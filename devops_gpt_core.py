@@ -5,21 +5,35 @@ Core Architecture and Plugin Framework
 """
 
 import asyncio
+import inspect
 import json
 import logging
+import os
 import re
-from abc import ABC, abstractmethod
+import stat
+import sys
+import time
+import weakref
+from abc import ABC
+from collections import deque
 from dataclasses import dataclass
 from enum import Enum
-from typing import Dict, List, Optional, Any, Callable
+from functools import lru_cache, partial
+from typing import Dict, List, Optional, Any, Callable, Tuple
 from datetime import datetime
-import subprocess
-import yaml
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 # Configure logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
+# dataclass(slots=True) needs Python 3.10+; older interpreters get regular dataclasses
+DATACLASS_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
 class TaskCategory(Enum):
     TROUBLESHOOTING = "troubleshooting"
     CICD = "cicd"
@@ -33,7 +47,7 @@ class ExecutionMode(Enum):
     CONFIRM = "confirm"
     EXECUTE = "execute"
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class Command:
     """Represents a parsed command with intent and parameters"""
     intent: str
@@ -43,7 +57,7 @@ class Command:
     confidence: float
     dry_run: bool = True
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class ExecutionResult:
     """Result of command execution"""
     success: bool
@@ -53,24 +67,118 @@ class ExecutionResult:
     command_executed: Optional[str] = None
     metadata: Dict[str, Any] = None
 
+@dataclass(**DATACLASS_SLOTS)
+class HistoryEntry:
+    """Session history record; slotted so long histories carry no per-entry dict"""
+    timestamp_ns: int
+    command: Command
+    result: ExecutionResult
+
+@dataclass(**DATACLASS_SLOTS)
+class AuditEntry:
+    """Audit trail record for a processed command"""
+    timestamp: str
+    user_input: str
+    intent: str
+    category: str
+    parameters: Dict[str, Any]
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Shallow field mapping for serialization (asdict() would deep-copy parameters)"""
+        return {
+            "timestamp": self.timestamp,
+            "user_input": self.user_input,
+            "intent": self.intent,
+            "category": self.category,
+            "parameters": self.parameters
+        }
+
+async def run_blocking(func: Callable, *args, **kwargs) -> Any:
+    """Run a blocking SDK call in the default executor so the event loop keeps serving other commands"""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(None, partial(func, *args, **kwargs))
+
 class BasePlugin(ABC):
     """Base class for all DevOpsGPT plugins"""
     
+    __slots__ = ("name", "category", "command_patterns", "required_permissions")
+    
+    # Maps each intent to the name of the coroutine method that handles it
+    intent_handlers: Dict[str, str] = {}
+    # Ordered (keywords, intent) routes for plugins that dispatch on the raw input;
+    # the first route whose keywords all appear in the input wins
+    keyword_routes: Tuple[Tuple[Tuple[str, ...], str], ...] = ()
+    unknown_command_output = "Unknown command"
+    # Error reported when no keyword route matches; formatted with raw_input
+    unrouted_error: Optional[str] = None
+    error_prefix = ""
+    # Intent -> handler table, resolved for each subclass by __init_subclass__; empty on BasePlugin itself
+    _handlers: Dict[str, Callable] = {}
+    
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        # Resolve handler names once per class so dispatch is a single dict lookup
+        cls._handlers = {
+            intent: getattr(cls, method_name)
+            for intent, method_name in cls.intent_handlers.items()
+            if hasattr(cls, method_name)
+        }
+    
     def __init__(self, name: str, category: TaskCategory):
         self.name = name
         self.category = category
         self.command_patterns = []
         self.required_permissions = []
     
-    @abstractmethod
-    async def can_handle(self, command: Command) -> bool:
-        """Check if this plugin can handle the given command"""
-        pass
+    def can_handle(self, command: Command) -> bool:
+        """Check if this plugin can handle the given command (by default: same category)"""
+        return command.category == self.category
     
-    @abstractmethod
     async def execute(self, command: Command) -> ExecutionResult:
         """Execute the command and return result"""
-        pass
+        intent, handler = self._resolve_handler(command)
+        if handler is None:
+            if intent is not None:
+                error = f"Intent '{intent}' not supported"
+            elif self.unrouted_error is not None:
+                error = self.unrouted_error.format(raw_input=command.raw_input)
+            else:
+                error = None
+            return ExecutionResult(
+                success=False,
+                output=self.unknown_command_output,
+                error=error
+            )
+        
+        try:
+            return await handler(self, command)
+        except Exception as e:
+            logger.error("Error executing command: %s", e)
+            return ExecutionResult(
+                success=False,
+                output="",
+                error=f"{self.error_prefix}{e}"
+            )
+    
+    def _resolve_handler(self, command: Command) -> Tuple[Optional[str], Optional[Callable]]:
+        """Find a command's intent and its handler, by keyword route if declared, else by intent
+        
+        The intent is None only when no keyword route matched.
+        """
+        if not self.keyword_routes:
+            return command.intent, self._handlers.get(command.intent)
+        
+        raw_input = command.raw_input.lower()
+        for keywords, intent in self.keyword_routes:
+            if all(keyword in raw_input for keyword in keywords):
+                return intent, self._handlers.get(intent)
+        return None, None
+    
+    def supported_categories(self) -> Optional[Tuple[TaskCategory, ...]]:
+        """Categories this plugin handles outright, or None if can_handle must be asked for every command"""
+        if type(self).can_handle is BasePlugin.can_handle:
+            return (self.category,)
+        return None
     
     def register_pattern(self, pattern: str, intent: str):
         """Register a command pattern this plugin can handle"""
@@ -79,60 +187,66 @@ class BasePlugin(ABC):
             'intent': intent
         })
 
+# Static intent table, built once at import and shared by every CommandParser
+INTENT_PATTERNS = {
+    # Troubleshooting patterns
+    r"show.*logs.*from.*(?P<service>\w+)": {
+        "intent": "show_logs",
+        "category": TaskCategory.TROUBLESHOOTING
+    },
+    r"restart.*(?P<service>\w+)": {
+        "intent": "restart_service", 
+        "category": TaskCategory.TROUBLESHOOTING
+    },
+    r"health.*check.*(?P<service>\w+)": {
+        "intent": "health_check",
+        "category": TaskCategory.TROUBLESHOOTING
+    },
+    
+    # CI/CD patterns
+    r"trigger.*(?P<pipeline>\w+).*pipeline": {
+        "intent": "trigger_pipeline",
+        "category": TaskCategory.CICD
+    },
+    r"rollback.*(?P<service>\w+)": {
+        "intent": "rollback_deployment",
+        "category": TaskCategory.CICD
+    },
+    
+    # Cloud provisioning
+    r"create.*(?P<resource_type>ec2|vm|instance)": {
+        "intent": "create_instance",
+        "category": TaskCategory.CLOUD_PROVISIONING
+    },
+    
+    # Cost analysis
+    r"show.*cost.*(?P<service>\w+)": {
+        "intent": "analyze_cost",
+        "category": TaskCategory.COST_USAGE
+    },
+    
+    # Security
+    r"check.*(?P<security_type>ports|cve|vulnerabilities)": {
+        "intent": "security_scan",
+        "category": TaskCategory.SECURITY_COMPLIANCE
+    }
+}
+
 class CommandParser:
     """Natural language command parser using pattern matching and LLM"""
     
     def __init__(self):
-        self.intent_patterns = {
-            # Troubleshooting patterns
-            r"show.*logs.*from.*(?P<service>\w+)": {
-                "intent": "show_logs",
-                "category": TaskCategory.TROUBLESHOOTING
-            },
-            r"restart.*(?P<service>\w+)": {
-                "intent": "restart_service", 
-                "category": TaskCategory.TROUBLESHOOTING
-            },
-            r"health.*check.*(?P<service>\w+)": {
-                "intent": "health_check",
-                "category": TaskCategory.TROUBLESHOOTING
-            },
-            
-            # CI/CD patterns
-            r"trigger.*(?P<pipeline>\w+).*pipeline": {
-                "intent": "trigger_pipeline",
-                "category": TaskCategory.CICD
-            },
-            r"rollback.*(?P<service>\w+)": {
-                "intent": "rollback_deployment",
-                "category": TaskCategory.CICD
-            },
-            
-            # Cloud provisioning
-            r"create.*(?P<resource_type>ec2|vm|instance)": {
-                "intent": "create_instance",
-                "category": TaskCategory.CLOUD_PROVISIONING
-            },
-            
-            # Cost analysis
-            r"show.*cost.*(?P<service>\w+)": {
-                "intent": "analyze_cost",
-                "category": TaskCategory.COST_USAGE
-            },
-            
-            # Security
-            r"check.*(?P<security_type>ports|cve|vulnerabilities)": {
-                "intent": "security_scan",
-                "category": TaskCategory.SECURITY_COMPLIANCE
-            }
-        }
+        self.intent_patterns = dict(INTENT_PATTERNS)
+        self._compiled_patterns = [
+            (re.compile(pattern), config) for pattern, config in self.intent_patterns.items()
+        ]
     
     async def parse(self, user_input: str) -> Command:
         """Parse natural language input into a structured command"""
         user_input = user_input.strip().lower()
         
-        for pattern, config in self.intent_patterns.items():
-            match = re.search(pattern, user_input)
+        for pattern, config in self._compiled_patterns:
+            match = pattern.search(user_input)
             if match:
                 parameters = match.groupdict()
                 return Command(
@@ -153,11 +267,34 @@ class CommandParser:
             confidence=0.1
         )
 
+# argv template per troubleshooting intent; "{service}" is filled in per command
+TROUBLESHOOTING_COMMANDS = {
+    "show_logs": ("kubectl", "logs", "-l", "app={service}", "--tail=50"),
+    "restart_service": ("kubectl", "rollout", "restart", "deployment/{service}"),
+    "health_check": ("kubectl", "get", "pods", "-l", "app={service}"),
+}
+
+@lru_cache(maxsize=256)
+def troubleshooting_command(intent: str, service: str) -> Tuple[Tuple[str, ...], str]:
+    """Render an intent's argv for a service, with its display string (memoized for repeat queries)"""
+    argv = tuple(arg.format(service=service) for arg in TROUBLESHOOTING_COMMANDS[intent])
+    return argv, " ".join(argv)
+
 class TroubleshootingPlugin(BasePlugin):
     """Plugin for troubleshooting operations"""
     
+    __slots__ = ("_subprocess_slots",)
+    
+    intent_handlers = {intent: "_run_kubectl" for intent in TROUBLESHOOTING_COMMANDS}
+    unknown_command_output = "Unknown troubleshooting command"
+    max_concurrent_subprocesses = 8
+    # Bytes of stdout/stderr kept per command; anything beyond is drained and dropped
+    output_limit = 1 << 20
+    
     def __init__(self):
         super().__init__("troubleshooting", TaskCategory.TROUBLESHOOTING)
+        # Created on first use so it binds to the running event loop
+        self._subprocess_slots: Optional[asyncio.Semaphore] = None
         self.register_patterns()
     
     def register_patterns(self):
@@ -165,95 +302,44 @@ class TroubleshootingPlugin(BasePlugin):
         self.register_pattern(r"restart.*service", "restart_service")
         self.register_pattern(r"health.*check", "health_check")
     
-    async def can_handle(self, command: Command) -> bool:
-        return command.category == TaskCategory.TROUBLESHOOTING
-    
-    async def execute(self, command: Command) -> ExecutionResult:
-        """Execute troubleshooting commands"""
-        start_time = datetime.now()
-        
-        try:
-            if command.intent == "show_logs":
-                return await self._show_logs(command)
-            elif command.intent == "restart_service":
-                return await self._restart_service(command)
-            elif command.intent == "health_check":
-                return await self._health_check(command)
-            else:
-                return ExecutionResult(
-                    success=False,
-                    output="Unknown troubleshooting command",
-                    error=f"Intent '{command.intent}' not supported"
-                )
-        except Exception as e:
-            logger.error(f"Error executing command: {e}")
-            return ExecutionResult(
-                success=False,
-                output="",
-                error=str(e)
-            )
-    
-    async def _show_logs(self, command: Command) -> ExecutionResult:
+    async def _run_kubectl(self, command: Command) -> ExecutionResult:
         service = command.parameters.get('service', 'unknown')
+        argv, cmd = troubleshooting_command(command.intent, service)
         
         if command.dry_run:
-            cmd = f"kubectl logs -l app={service} --tail=50"
             return ExecutionResult(
                 success=True,
                 output=f"[DRY RUN] Would execute: {cmd}",
                 command_executed=cmd
             )
         
-        # In real implementation, execute kubectl or docker logs
-        cmd = f"kubectl logs -l app={service} --tail=50"
-        result = await self._execute_shell_command(cmd)
-        return result
+        return await self._execute_command(argv, cmd)
     
-    async def _restart_service(self, command: Command) -> ExecutionResult:
-        service = command.parameters.get('service', 'unknown')
-        
-        if command.dry_run:
-            cmd = f"kubectl rollout restart deployment/{service}"
-            return ExecutionResult(
-                success=True,
-                output=f"[DRY RUN] Would execute: {cmd}",
-                command_executed=cmd
-            )
+    async def _execute_command(self, argv: Tuple[str, ...], cmd: str) -> ExecutionResult:
+        """Execute a command directly (no shell) from its argument vector"""
+        if self._subprocess_slots is None:
+            self._subprocess_slots = asyncio.Semaphore(self.max_concurrent_subprocesses)
         
-        cmd = f"kubectl rollout restart deployment/{service}"
-        result = await self._execute_shell_command(cmd)
-        return result
-    
-    async def _health_check(self, command: Command) -> ExecutionResult:
-        service = command.parameters.get('service', 'unknown')
-        
-        if command.dry_run:
-            cmd = f"kubectl get pods -l app={service}"
-            return ExecutionResult(
-                success=True,
-                output=f"[DRY RUN] Would execute: {cmd}",
-                command_executed=cmd
-            )
-        
-        cmd = f"kubectl get pods -l app={service}"
-        result = await self._execute_shell_command(cmd)
-        return result
-    
-    async def _execute_shell_command(self, cmd: str) -> ExecutionResult:
-        """Execute shell command safely"""
         try:
-            process = await asyncio.create_subprocess_shell(
-                cmd,
-                stdout=asyncio.subprocess.PIPE,
-                stderr=asyncio.subprocess.PIPE
-            )
-            stdout, stderr = await process.communicate()
+            # Bound concurrent launches so batched commands don't fork-storm
+            async with self._subprocess_slots:
+                process = await asyncio.create_subprocess_exec(
+                    *argv,
+                    stdout=asyncio.subprocess.PIPE,
+                    stderr=asyncio.subprocess.PIPE
+                )
+                (stdout, stdout_truncated), (stderr, stderr_truncated) = await asyncio.gather(
+                    self._read_capped(process.stdout, self.output_limit),
+                    self._read_capped(process.stderr, self.output_limit)
+                )
+                await process.wait()
             
             return ExecutionResult(
                 success=process.returncode == 0,
-                output=stdout.decode() if stdout else "",
-                error=stderr.decode() if stderr else None,
-                command_executed=cmd
+                output=stdout.decode(errors="replace") if stdout else "",
+                error=stderr.decode(errors="replace") if stderr else None,
+                command_executed=cmd,
+                metadata={'truncated': True} if stdout_truncated or stderr_truncated else None
             )
         except Exception as e:
             return ExecutionResult(
@@ -263,43 +349,158 @@ class TroubleshootingPlugin(BasePlugin):
                 command_executed=cmd
             )
 
+    @staticmethod
+    async def _read_capped(stream: asyncio.StreamReader, limit: int) -> Tuple[bytes, bool]:
+        """Read a stream to EOF, keeping at most limit bytes so the child never blocks on a full pipe
+        
+        Returns the kept bytes and whether anything beyond them was dropped.
+        """
+        buffer = bytearray()
+        truncated = False
+        while True:
+            chunk = await stream.read(65536)
+            if not chunk:
+                return bytes(buffer), truncated
+            room = limit - len(buffer)
+            if len(chunk) > room:
+                truncated = True
+            if room > 0:
+                buffer += chunk[:room]
+
 class SessionContext:
     """Maintains session context for conversation continuity"""
     
-    def __init__(self):
+    __slots__ = ("namespace", "current_service", "cloud_provider", "history")
+    
+    def __init__(self, history_size: int = 1000):
         self.namespace = "default"
         self.current_service = None
         self.cloud_provider = None
-        self.history = []
+        # Ring buffer: long-running sessions keep only the most recent entries
+        self.history = deque(maxlen=history_size)
     
     def update_context(self, command: Command, result: ExecutionResult):
         """Update context based on executed command"""
-        self.history.append({
-            'timestamp': datetime.now(),
-            'command': command,
-            'result': result
-        })
+        # Monotonic clock: only used for ordering/intervals, human-readable stamps live in the audit log
+        self.history.append(HistoryEntry(time.monotonic_ns(), command, result))
         
         # Extract context from parameters
         if 'service' in command.parameters:
             self.current_service = command.parameters['service']
 
+def _write_pending_and_close(file, pending: List[bytes]):
+    """Finalizer for AuditLogSink; takes the file and buffer, not the sink, so it never keeps one alive"""
+    if not file.closed:
+        if pending:
+            file.write(b"".join(pending))
+            pending.clear()
+        file.close()
+
+class AuditLogSink:
+    """Append-only JSON-lines audit file that batches entries into few writes"""
+    
+    __slots__ = (
+        "path", "flush_every", "flush_interval", "_pending", "_oldest_pending",
+        "_flush_timer", "_file", "_finalizer", "__weakref__",
+    )
+    
+    def __init__(self, path: str, flush_every: int = 64, flush_interval: float = 1.0):
+        self.path = path
+        self.flush_every = flush_every
+        self.flush_interval = flush_interval
+        self._pending: List[bytes] = []
+        self._oldest_pending = 0.0
+        self._flush_timer: Optional[asyncio.TimerHandle] = None
+        self._file = open(path, "ab")
+        # Pending entries must not be lost if the owner never calls close(); runs on
+        # garbage collection or at exit, whichever comes first
+        self._finalizer = weakref.finalize(self, _write_pending_and_close, self._file, self._pending)
+    
+    @staticmethod
+    def _encode(entry: AuditEntry) -> bytes:
+        """Serialize an entry as one compact JSON line, via orjson when it is installed"""
+        if orjson is not None:
+            # orjson serializes dataclasses natively and emits bytes directly
+            return orjson.dumps(entry, default=str, option=orjson.OPT_APPEND_NEWLINE)
+        return json.dumps(entry.to_dict(), default=str, ensure_ascii=False, separators=(",", ":")).encode() + b"\n"
+    
+    def enqueue(self, entry: AuditEntry):
+        """Buffer an entry, writing the batch out once it is flush_every long or flush_interval old
+        
+        Inside an event loop the age bound is enforced by a timer; without one it is
+        checked on the next enqueue.
+        """
+        now = time.monotonic()
+        if not self._pending:
+            self._oldest_pending = now
+            self._schedule_flush()
+        self._pending.append(self._encode(entry))
+        if len(self._pending) >= self.flush_every or now - self._oldest_pending >= self.flush_interval:
+            self.flush()
+    
+    def _schedule_flush(self):
+        """Flush after flush_interval even if no further entry arrives"""
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return
+        self._flush_timer = loop.call_later(self.flush_interval, self.flush)
+    
+    def flush(self):
+        """Write all pending entries with a single write call"""
+        if self._flush_timer is not None:
+            self._flush_timer.cancel()
+            self._flush_timer = None
+        if self._pending:
+            self._file.write(b"".join(self._pending))
+            self._file.flush()
+            self._pending.clear()
+    
+    def close(self):
+        if self._flush_timer is not None:
+            self._flush_timer.cancel()
+            self._flush_timer = None
+        self._finalizer()
+
 class DevOpsGPT:
     """Main DevOpsGPT Agent class"""
     
-    def __init__(self):
+    def __init__(self, audit_log_size: int = 10_000, audit_log_path: Optional[str] = None):
         self.parser = CommandParser()
         self.plugins: List[BasePlugin] = []
+        self._plugins_by_category: Dict[TaskCategory, List[Tuple[BasePlugin, bool]]] = {}
         self.context = SessionContext()
-        self.audit_log = []
+        # Ring buffer like SessionContext.history: keeps the in-memory trail bounded
+        self.audit_log = deque(maxlen=audit_log_size)
+        self._audit_sink = AuditLogSink(audit_log_path) if audit_log_path else None
         
         # Register default plugins
         self.register_plugin(TroubleshootingPlugin())
     
     def register_plugin(self, plugin: BasePlugin):
         """Register a new plugin"""
+        if inspect.iscoroutinefunction(type(plugin).can_handle):
+            # An un-awaited coroutine is truthy, so the plugin would claim every command it is asked about
+            raise TypeError(f"{type(plugin).__name__}.can_handle must be synchronous, not 'async def'")
         self.plugins.append(plugin)
-        logger.info(f"Registered plugin: {plugin.name}")
+        self._index_plugins()
+        logger.info("Registered plugin: %s", plugin.name)
+    
+    def _index_plugins(self):
+        """Precompute, per category, the plugins that may handle it (in registration order)
+        
+        Each candidate is paired with whether can_handle still has to be consulted;
+        plugins indexed by their declared categories match without a call.
+        """
+        index = {category: [] for category in TaskCategory}
+        for plugin in self.plugins:
+            categories = plugin.supported_categories()
+            for category, candidates in index.items():
+                if categories is None:
+                    candidates.append((plugin, True))
+                elif category in categories:
+                    candidates.append((plugin, False))
+        self._plugins_by_category = index
     
     async def process_command(self, user_input: str, execution_mode: ExecutionMode = ExecutionMode.DRY_RUN) -> ExecutionResult:
         """Process natural language command"""
@@ -311,14 +512,16 @@ class DevOpsGPT:
         self._audit_log(command)
         
         # Find appropriate plugin
-        for plugin in self.plugins:
-            if await plugin.can_handle(command):
-                result = await plugin.execute(command)
-                
-                # Update context
-                self.context.update_context(command, result)
-                
-                return result
+        for plugin, needs_probe in self._plugins_by_category[command.category]:
+            if needs_probe and not plugin.can_handle(command):
+                continue
+            
+            result = await plugin.execute(command)
+            
+            # Update context
+            self.context.update_context(command, result)
+            
+            return result
         
         # No plugin found
         return ExecutionResult(
@@ -326,18 +529,32 @@ class DevOpsGPT:
             output="No plugin found to handle this command",
             error=f"Unsupported command: {user_input}"
         )
-    
+
+    async def process_commands(self, user_inputs: List[str], execution_mode: ExecutionMode = ExecutionMode.DRY_RUN) -> List[ExecutionResult]:
+        """Process several commands concurrently, returning results in input order"""
+        return await asyncio.gather(
+            *(self.process_command(user_input, execution_mode) for user_input in user_inputs)
+        )
+
     def _audit_log(self, command: Command):
         """Log command for audit trail"""
-        audit_entry = {
-            'timestamp': datetime.now().isoformat(),
-            'user_input': command.raw_input,
-            'intent': command.intent,
-            'category': command.category.value,
-            'parameters': command.parameters
-        }
+        audit_entry = AuditEntry(
+            timestamp=datetime.now().isoformat(),
+            user_input=command.raw_input,
+            intent=command.intent,
+            category=command.category.value,
+            parameters=command.parameters
+        )
         self.audit_log.append(audit_entry)
-        logger.info(f"Command logged: {command.intent}")
+        if self._audit_sink is not None:
+            self._audit_sink.enqueue(audit_entry)
+        logger.info("Command logged: %s", command.intent)
+    
+    def close(self):
+        """Flush and close the persistent audit log, if one is configured"""
+        if self._audit_sink is not None:
+            self._audit_sink.close()
+            self._audit_sink = None
 
 # CLI Interface
 class DevOpsGPTCLI:
@@ -352,19 +569,31 @@ class DevOpsGPTCLI:
         print("Type 'help' for commands, 'quit' to exit")
         print("-" * 50)
         
+        reader, transport = await self._connect_stdin()
+        try:
+            await self._command_loop(reader)
+        finally:
+            if transport is not None:
+                transport.close()
+                # The pipe transport leaves stdin non-blocking, which the parent shell shares
+                os.set_blocking(sys.stdin.fileno(), True)
+    
+    async def _command_loop(self, reader: Optional[asyncio.StreamReader]):
+        """Read and process commands until the user quits or input ends"""
         while True:
             try:
-                user_input = input("\n💬 DevOpsGPT> ").strip()
+                user_input = (await self._read_input(reader, "\n💬 DevOpsGPT> ")).strip()
+                control = user_input.lower()
                 
-                if user_input.lower() in ['quit', 'exit']:
+                if control in ('quit', 'exit'):
                     print("👋 Goodbye!")
                     break
                 
-                if user_input.lower() == 'help':
+                if control == 'help':
                     self._show_help()
                     continue
                 
-                if user_input.lower() == 'execute':
+                if control == 'execute':
                     print("⚡ Switching to EXECUTE mode for next command")
                     execution_mode = ExecutionMode.EXECUTE
                     continue
@@ -375,12 +604,55 @@ class DevOpsGPTCLI:
                 # Display result
                 self._display_result(result)
                 
-            except KeyboardInterrupt:
+            except (KeyboardInterrupt, EOFError):
                 print("\n👋 Goodbye!")
                 break
+            except asyncio.CancelledError:
+                print("\n👋 Goodbye!")
+                raise
             except Exception as e:
                 print(f"❌ Error: {e}")
     
+    @staticmethod
+    async def _connect_stdin() -> Tuple[Optional[asyncio.StreamReader], Optional[asyncio.ReadTransport]]:
+        """Attach an asyncio stream to stdin, or (None, None) where the loop can't watch it
+        
+        The transport reads a duplicate descriptor: it closes its pipe at end of input,
+        which must not close sys.stdin itself.
+        """
+        try:
+            fd = sys.stdin.fileno()
+            mode = os.fstat(fd).st_mode
+        except (ValueError, OSError):
+            # stdin closed or not backed by a file descriptor
+            return None, None
+        # Regular files and devices like /dev/null can't be polled; input() reads those fine
+        if not (stat.S_ISFIFO(mode) or stat.S_ISSOCK(mode) or os.isatty(fd)):
+            return None, None
+        
+        loop = asyncio.get_running_loop()
+        reader = asyncio.StreamReader()
+        pipe = os.fdopen(os.dup(fd), "rb", buffering=0)
+        try:
+            transport, _ = await loop.connect_read_pipe(lambda: asyncio.StreamReaderProtocol(reader), pipe)
+        except (NotImplementedError, ValueError, OSError):
+            # e.g. a Windows event loop
+            pipe.close()
+            return None, None
+        return reader, transport
+    
+    @staticmethod
+    async def _read_input(reader: Optional[asyncio.StreamReader], prompt: str) -> str:
+        """Read one line without blocking the event loop; raises EOFError at end of input"""
+        if reader is None:
+            return await asyncio.get_running_loop().run_in_executor(None, input, prompt)
+        
+        print(prompt, end="", flush=True)
+        line = await reader.readline()
+        if not line:
+            raise EOFError
+        return line.decode().rstrip("\r\n")
+    
     def _show_help(self):
         """Show help information"""
         help_text = """
@@ -430,5 +702,22 @@ async def main():
     cli = DevOpsGPTCLI()
     await cli.run_interactive()
 
+def run(coro):
+    """Run a coroutine to completion, on a uvloop loop when uvloop is installed (Python 3.11+)"""
+    if sys.version_info >= (3, 11):
+        try:
+            import uvloop
+        except ImportError:
+            pass
+        else:
+            # A loop factory scopes uvloop to this run instead of changing the process-wide policy
+            with asyncio.Runner(loop_factory=uvloop.new_event_loop) as runner:
+                return runner.run(coro)
+    return asyncio.run(coro)
+
 if __name__ == "__main__":
-    asyncio.run(main())
\ No newline at end of file
+    try:
+        run(main())
+    except KeyboardInterrupt:
+        # Ctrl-C cancels the session task, which has already said goodbye
+        pass
\ No newline at end of file
@@ -5,19 +5,29 @@ Cloud Provider Plugins and Configuration Management
 """
 
 import json
-import boto3
-from azure.identity import DefaultAzureCredential
-from azure.mgmt.compute import ComputeManagementClient
-from google.cloud import compute_v1
-import kubernetes
-from kubernetes import client, config
 import yaml
 import os
-from typing import Dict, List, Any
+import copy
+import hashlib
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import Dict, List, Any, Optional
 from dataclasses import dataclass
-from devops_gpt_core import BasePlugin, TaskCategory, Command, ExecutionResult
+try:
+    # libyaml bindings, when PyYAML was built with them
+    from yaml import CSafeLoader as YAMLLoader, CSafeDumper as YAMLDumper
+except ImportError:
+    from yaml import SafeLoader as YAMLLoader, SafeDumper as YAMLDumper
 
-@dataclass
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+from devops_gpt_core import BasePlugin, TaskCategory, Command, ExecutionResult, ExecutionMode, DATACLASS_SLOTS, run, run_blocking
+
+@dataclass(frozen=True, **DATACLASS_SLOTS)
 class CloudConfig:
     """Cloud provider configuration"""
     provider: str  # aws, azure, gcp
@@ -25,12 +35,39 @@ class CloudConfig:
     credentials: Dict[str, Any]
     default_tags: Dict[str, str] = None
 
+@dataclass(frozen=True, **DATACLASS_SLOTS)
+class ResolvedConfig:
+    """Plugin settings looked up once from the nested configuration"""
+    k8s_context: Optional[str]
+    k8s_namespace: str
+    prometheus_url: Optional[str]
+    grafana_url: Optional[str]
+    
+    @classmethod
+    def from_config(cls, config: Dict[str, Any]) -> "ResolvedConfig":
+        kubernetes = config.get("kubernetes", {})
+        monitoring = config.get("monitoring", {})
+        return cls(
+            k8s_context=kubernetes.get("context"),
+            k8s_namespace=kubernetes.get("namespace", "default"),
+            prometheus_url=monitoring.get("prometheus_url"),
+            grafana_url=monitoring.get("grafana_url")
+        )
+
+@lru_cache(maxsize=8)
+def _read_config_file(path: str, mtime_ns: int) -> Any:
+    """Parse a YAML config file; keyed on its mtime so edits are picked up on the next load"""
+    with open(path, 'r') as f:
+        return yaml.load(f, Loader=YAMLLoader)
+
 class ConfigManager:
     """Manages DevOpsGPT configuration"""
     
     def __init__(self, config_path: str = "devops_gpt_config.yaml"):
         self.config_path = config_path
         self.config = self._load_config()
+        self.resolved = ResolvedConfig.from_config(self.config)
+        self._cloud_configs: Dict[str, CloudConfig] = {}
     
     def _load_config(self) -> Dict[str, Any]:
         """Load configuration from YAML file"""
@@ -66,79 +103,122 @@ class ConfigManager:
         
         try:
             if os.path.exists(self.config_path):
-                with open(self.config_path, 'r') as f:
-                    user_config = yaml.safe_load(f)
-                    # Merge with defaults
-                    default_config.update(user_config)
+                user_config = _read_config_file(self.config_path, os.stat(self.config_path).st_mtime_ns)
+                # Merge with defaults (copied, as the parsed file is shared through the cache)
+                default_config.update(copy.deepcopy(user_config))
             else:
                 # Create default config file
-                with open(self.config_path, 'w') as f:
-                    yaml.dump(default_config, f, default_flow_style=False)
+                self._write_atomically(
+                    yaml.dump(default_config, Dumper=YAMLDumper, default_flow_style=False)
+                )
         except Exception as e:
             print(f"Warning: Could not load config: {e}")
         
         return default_config
     
+    def _write_atomically(self, text: str):
+        """Replace the config file in one step, so readers never see a partial file"""
+        tmp_path = f"{self.config_path}.{os.getpid()}.tmp"
+        try:
+            with open(tmp_path, 'w') as f:
+                f.write(text)
+            os.replace(tmp_path, self.config_path)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+    
     def get_cloud_config(self, provider: str) -> CloudConfig:
-        """Get cloud provider configuration"""
-        provider_config = self.config.get("cloud_providers", {}).get(provider, {})
-        return CloudConfig(
-            provider=provider,
-            region=provider_config.get("region", "us-east-1"),
-            credentials=provider_config,
-            default_tags={"CreatedBy": "DevOpsGPT", "Purpose": "Automation"}
-        )
+        """Get cloud provider configuration (resolved once per provider)"""
+        cloud_config = self._cloud_configs.get(provider)
+        if cloud_config is None:
+            provider_config = self.config.get("cloud_providers", {}).get(provider, {})
+            cloud_config = CloudConfig(
+                provider=provider,
+                region=provider_config.get("region", "us-east-1"),
+                credentials=provider_config,
+                default_tags={"CreatedBy": "DevOpsGPT", "Purpose": "Automation"}
+            )
+            self._cloud_configs[provider] = cloud_config
+        return cloud_config
+
+@lru_cache(maxsize=8)
+def _shared_config_manager(path: str, mtime_ns: Optional[int]) -> ConfigManager:
+    return ConfigManager(path)
+
+def get_config_manager(config_path: str = "devops_gpt_config.yaml") -> ConfigManager:
+    """Shared ConfigManager per config file, rebuilt once the file is edited"""
+    path = os.path.abspath(config_path)
+    try:
+        mtime_ns = os.stat(path).st_mtime_ns
+    except OSError:
+        mtime_ns = None
+    return _shared_config_manager(path, mtime_ns)
+
+# JMESPath projection flattening DescribeInstances pages into one summary per instance
+EC2_INSTANCE_SUMMARY = (
+    "Reservations[].Instances[].{"
+    "InstanceId: InstanceId, "
+    "Name: Tags[?Key=='Name'] | [0].Value, "
+    "State: State.Name, "
+    "InstanceType: InstanceType, "
+    "PublicIpAddress: PublicIpAddress}"
+)
 
 class AWSPlugin(BasePlugin):
     """AWS cloud operations plugin"""
     
+    __slots__ = ("config", "session", "_ec2")
+    
+    AWS_INTENTS = frozenset({"create_ec2_instance", "list_ec2_instances", "terminate_instance", "analyze_cost"})
+    
+    intent_handlers = {
+        "create_ec2_instance": "_create_ec2_instance",
+        "list_ec2_instances": "_list_ec2_instances",
+        "terminate_instance": "_terminate_instance",
+        "analyze_cost": "_analyze_cost",
+    }
+    unknown_command_output = "Unknown AWS command"
+    error_prefix = "AWS operation failed: "
+    
+    # botocore client settings: a pool large enough for concurrent commands, adaptive retries
+    CLIENT_CONFIG = {
+        "max_pool_connections": 50,
+        "retries": {"max_attempts": 3, "mode": "adaptive"},
+        "tcp_keepalive": True,
+    }
+    
     def __init__(self, config_manager: ConfigManager):
+        # Imported here so the SDK is only loaded when the AWS plugin is actually used
+        import boto3
+        
         super().__init__("aws", TaskCategory.CLOUD_PROVISIONING)
         self.config = config_manager.get_cloud_config("aws")
         self.session = boto3.Session(
             profile_name=self.config.credentials.get("profile", "default"),
             region_name=self.config.region
         )
+        self._ec2 = None
         self.register_patterns()
     
+    def _ec2_client(self):
+        """EC2 client, created on first real call and reused (with its connection pool) after"""
+        if self._ec2 is None:
+            from botocore.config import Config
+            self._ec2 = self.session.client('ec2', config=Config(**self.CLIENT_CONFIG))
+        return self._ec2
+    
     def register_patterns(self):
         self.register_pattern(r"create.*ec2.*instance", "create_ec2_instance")
         self.register_pattern(r"list.*ec2.*instances", "list_ec2_instances")
         self.register_pattern(r"terminate.*instance.*(?P<instance_id>i-\w+)", "terminate_instance")
         self.register_pattern(r"show.*cost.*(?P<service>\w+)", "analyze_cost")
     
-    async def can_handle(self, command: Command) -> bool:
-        aws_intents = ["create_ec2_instance", "list_ec2_instances", "terminate_instance", "analyze_cost"]
-        return command.intent in aws_intents or "ec2" in command.raw_input.lower()
-    
-    async def execute(self, command: Command) -> ExecutionResult:
-        """Execute AWS operations"""
-        try:
-            if command.intent == "create_ec2_instance":
-                return await self._create_ec2_instance(command)
-            elif command.intent == "list_ec2_instances":
-                return await self._list_ec2_instances(command)
-            elif command.intent == "terminate_instance":
-                return await self._terminate_instance(command)
-            elif command.intent == "analyze_cost":
-                return await self._analyze_cost(command)
-            else:
-                return ExecutionResult(
-                    success=False,
-                    output="Unknown AWS command",
-                    error=f"Intent '{command.intent}' not supported"
-                )
-        except Exception as e:
-            return ExecutionResult(
-                success=False,
-                output="",
-                error=f"AWS operation failed: {str(e)}"
-            )
+    def can_handle(self, command: Command) -> bool:
+        return command.intent in self.AWS_INTENTS or "ec2" in command.raw_input
     
     async def _create_ec2_instance(self, command: Command) -> ExecutionResult:
         """Create EC2 instance"""
-        ec2 = self.session.client('ec2')
-        
         # Default instance configuration
         instance_config = {
             'ImageId': 'ami-0c02fb55956c7d316',  # Amazon Linux 2 AMI
@@ -164,7 +244,7 @@ class AWSPlugin(BasePlugin):
             )
         
         # Execute instance creation
-        response = ec2.run_instances(**instance_config)
+        response = await run_blocking(self._ec2_client().run_instances, **instance_config)
         instance_id = response['Instances'][0]['InstanceId']
         
         return ExecutionResult(
@@ -173,10 +253,23 @@ class AWSPlugin(BasePlugin):
             metadata={'instance_id': instance_id, 'response': response}
         )
     
+    @staticmethod
+    def _describe_all_instances(ec2) -> List[Dict[str, Any]]:
+        """Summaries of every instance, across all DescribeInstances pages (blocking)"""
+        pages = ec2.get_paginator('describe_instances').paginate(PaginationConfig={'PageSize': 1000})
+        return [
+            {
+                'InstanceId': instance['InstanceId'],
+                'Name': 'Unnamed' if instance['Name'] is None else instance['Name'],
+                'State': instance['State'],
+                'InstanceType': instance['InstanceType'],
+                'PublicIpAddress': 'N/A' if instance['PublicIpAddress'] is None else instance['PublicIpAddress']
+            }
+            for instance in pages.search(EC2_INSTANCE_SUMMARY)
+        ]
+    
     async def _list_ec2_instances(self, command: Command) -> ExecutionResult:
         """List EC2 instances"""
-        ec2 = self.session.client('ec2')
-        
         if command.dry_run:
             return ExecutionResult(
                 success=True,
@@ -184,23 +277,12 @@ class AWSPlugin(BasePlugin):
                 command_executed="ec2.describe_instances()"
             )
         
-        response = ec2.describe_instances()
-        instances = []
+        instances = await run_blocking(self._describe_all_instances, self._ec2_client())
         
-        for reservation in response['Reservations']:
-            for instance in reservation['Instances']:
-                name = next((tag['Value'] for tag in instance.get('Tags', []) if tag['Key'] == 'Name'), 'Unnamed')
-                instances.append({
-                    'InstanceId': instance['InstanceId'],
-                    'Name': name,
-                    'State': instance['State']['Name'],
-                    'InstanceType': instance['InstanceType'],
-                    'PublicIpAddress': instance.get('PublicIpAddress', 'N/A')
-                })
-        
-        output = "📋 EC2 Instances:\n"
-        for inst in instances:
-            output += f"  • {inst['Name']} ({inst['InstanceId']}) - {inst['State']} - {inst['InstanceType']}\n"
+        output = "📋 EC2 Instances:\n" + "".join(
+            f"  • {inst['Name']} ({inst['InstanceId']}) - {inst['State']} - {inst['InstanceType']}\n"
+            for inst in instances
+        )
         
         return ExecutionResult(
             success=True,
@@ -208,21 +290,58 @@ class AWSPlugin(BasePlugin):
             metadata={'instances': instances}
         )
 
+def _kubeconfig_mtime_ns() -> Optional[int]:
+    """Latest mtime among the kubeconfig files in use, or None if they can't be read"""
+    paths = os.environ.get("KUBECONFIG", "~/.kube/config").split(os.pathsep)
+    try:
+        return max(os.stat(os.path.expanduser(path)).st_mtime_ns for path in paths if path)
+    except (OSError, ValueError):
+        return None
+
+@lru_cache(maxsize=4)
+def _kube_clients(context: Optional[str], kubeconfig_mtime_ns: Optional[int]):
+    """Core and Apps API clients for a context, shared by plugin instances until the kubeconfig changes"""
+    # Imported here so the client (and its generated models) only load when used
+    from kubernetes import client, config
+    
+    config.load_kube_config(context=context)
+    return client.CoreV1Api(), client.AppsV1Api()
+
 class KubernetesPlugin(BasePlugin):
     """Kubernetes operations plugin"""
     
+    __slots__ = ("config", "context", "namespace", "v1", "apps_v1")
+    
+    K8S_KEYWORDS = ("pod", "deployment", "service", "namespace", "kubectl")
+    
+    intent_handlers = {
+        "get_pods": "_get_pods",
+        "describe_pod": "_describe_pod",
+        "scale_deployment": "_scale_deployment",
+        "create_namespace": "_create_namespace",
+    }
+    keyword_routes = (
+        (("pods",), "get_pods"),
+        (("describe",), "describe_pod"),
+        (("scale",), "scale_deployment"),
+        (("namespace",), "create_namespace"),
+    )
+    unknown_command_output = "Unknown Kubernetes command"
+    unrouted_error = "Could not parse: {raw_input}"
+    error_prefix = "Kubernetes operation failed: "
+    
     def __init__(self, config_manager: ConfigManager):
         super().__init__("kubernetes", TaskCategory.TROUBLESHOOTING)
         self.config = config_manager.config.get("kubernetes", {})
+        self.context = config_manager.resolved.k8s_context
+        self.namespace = config_manager.resolved.k8s_namespace
         self._load_kube_config()
         self.register_patterns()
     
     def _load_kube_config(self):
         """Load Kubernetes configuration"""
         try:
-            config.load_kube_config(context=self.config.get("context"))
-            self.v1 = client.CoreV1Api()
-            self.apps_v1 = client.AppsV1Api()
+            self.v1, self.apps_v1 = _kube_clients(self.context, _kubeconfig_mtime_ns())
         except Exception as e:
             print(f"Warning: Could not load Kubernetes config: {e}")
             self.v1 = None
@@ -234,9 +353,8 @@ class KubernetesPlugin(BasePlugin):
         self.register_pattern(r"scale.*deployment.*(?P<deployment>\w+).*(?P<replicas>\d+)", "scale_deployment")
         self.register_pattern(r"create.*namespace.*(?P<namespace>\w+)", "create_namespace")
     
-    async def can_handle(self, command: Command) -> bool:
-        k8s_keywords = ["pod", "deployment", "service", "namespace", "kubectl"]
-        return any(keyword in command.raw_input.lower() for keyword in k8s_keywords)
+    def can_handle(self, command: Command) -> bool:
+        return any(keyword in command.raw_input for keyword in self.K8S_KEYWORDS)
     
     async def execute(self, command: Command) -> ExecutionResult:
         """Execute Kubernetes operations"""
@@ -247,31 +365,11 @@ class KubernetesPlugin(BasePlugin):
                 error="Kubernetes client not configured"
             )
         
-        try:
-            if "pods" in command.raw_input.lower():
-                return await self._get_pods(command)
-            elif "describe" in command.raw_input.lower():
-                return await self._describe_pod(command)
-            elif "scale" in command.raw_input.lower():
-                return await self._scale_deployment(command)
-            elif "namespace" in command.raw_input.lower():
-                return await self._create_namespace(command)
-            else:
-                return ExecutionResult(
-                    success=False,
-                    output="Unknown Kubernetes command",
-                    error=f"Could not parse: {command.raw_input}"
-                )
-        except Exception as e:
-            return ExecutionResult(
-                success=False,
-                output="",
-                error=f"Kubernetes operation failed: {str(e)}"
-            )
+        return await super().execute(command)
     
     async def _get_pods(self, command: Command) -> ExecutionResult:
         """Get pods in namespace"""
-        namespace = command.parameters.get('namespace', self.config.get('namespace', 'default'))
+        namespace = command.parameters.get('namespace', self.namespace)
         
         if command.dry_run:
             return ExecutionResult(
@@ -280,24 +378,37 @@ class KubernetesPlugin(BasePlugin):
                 command_executed=f"kubectl get pods -n {namespace}"
             )
         
-        pods = self.v1.list_namespaced_pod(namespace=namespace)
+        pods = await run_blocking(self._list_pods, self.v1, namespace)
         
-        output = f"🚀 Pods in namespace '{namespace}':\n"
-        for pod in pods.items:
-            status = pod.status.phase
-            output += f"  • {pod.metadata.name} - {status}\n"
+        output = f"🚀 Pods in namespace '{namespace}':\n" + "".join(
+            f"  • {pod['metadata']['name']} - {pod.get('status', {}).get('phase')}\n" for pod in pods
+        )
         
         return ExecutionResult(
             success=True,
             output=output,
-            metadata={'pod_count': len(pods.items)}
+            metadata={'pod_count': len(pods)}
         )
     
+    @staticmethod
+    def _list_pods(v1, namespace: str) -> List[Dict[str, Any]]:
+        """Pods in a namespace as plain dicts (blocking)
+        
+        Reads the raw response body rather than letting the client build OpenAPI model
+        objects for every pod, of which only the name and phase are used.
+        """
+        response = v1.list_namespaced_pod(namespace=namespace, _preload_content=False)
+        try:
+            data = response.data
+        finally:
+            response.release_conn()
+        return (orjson.loads(data) if orjson is not None else json.loads(data))["items"]
+    
     async def _scale_deployment(self, command: Command) -> ExecutionResult:
         """Scale deployment"""
         deployment = command.parameters.get('deployment', 'unknown')
         replicas = int(command.parameters.get('replicas', 1))
-        namespace = self.config.get('namespace', 'default')
+        namespace = self.namespace
         
         if command.dry_run:
             return ExecutionResult(
@@ -308,7 +419,8 @@ class KubernetesPlugin(BasePlugin):
         
         # Scale the deployment
         body = {'spec': {'replicas': replicas}}
-        self.apps_v1.patch_namespaced_deployment_scale(
+        await run_blocking(
+            self.apps_v1.patch_namespaced_deployment_scale,
             name=deployment,
             namespace=namespace,
             body=body
@@ -323,11 +435,28 @@ class KubernetesPlugin(BasePlugin):
 class MonitoringPlugin(BasePlugin):
     """Monitoring and alerting plugin"""
     
+    __slots__ = ("config", "prometheus_url", "grafana_url")
+    
+    MONITORING_KEYWORDS = ("metrics", "alerts", "cpu", "memory", "prometheus", "grafana")
+    
+    intent_handlers = {
+        "show_metrics": "_show_metrics",
+        "check_alerts": "_check_alerts",
+        "cpu_usage": "_cpu_usage",
+    }
+    keyword_routes = (
+        (("metrics",), "show_metrics"),
+        (("alerts",), "check_alerts"),
+        (("cpu",), "cpu_usage"),
+    )
+    unknown_command_output = "Unknown monitoring command"
+    error_prefix = "Monitoring operation failed: "
+    
     def __init__(self, config_manager: ConfigManager):
         super().__init__("monitoring", TaskCategory.MONITORING_ALERTS)
         self.config = config_manager.config.get("monitoring", {})
-        self.prometheus_url = self.config.get("prometheus_url")
-        self.grafana_url = self.config.get("grafana_url")
+        self.prometheus_url = config_manager.resolved.prometheus_url
+        self.grafana_url = config_manager.resolved.grafana_url
         self.register_patterns()
     
     def register_patterns(self):
@@ -335,30 +464,8 @@ class MonitoringPlugin(BasePlugin):
         self.register_pattern(r"check.*alerts", "check_alerts")
         self.register_pattern(r"cpu.*usage.*(?P<service>\w+)", "cpu_usage")
     
-    async def can_handle(self, command: Command) -> bool:
-        monitoring_keywords = ["metrics", "alerts", "cpu", "memory", "prometheus", "grafana"]
-        return any(keyword in command.raw_input.lower() for keyword in monitoring_keywords)
-    
-    async def execute(self, command: Command) -> ExecutionResult:
-        """Execute monitoring operations"""
-        try:
-            if "metrics" in command.raw_input.lower():
-                return await self._show_metrics(command)
-            elif "alerts" in command.raw_input.lower():
-                return await self._check_alerts(command)
-            elif "cpu" in command.raw_input.lower():
-                return await self._cpu_usage(command)
-            else:
-                return ExecutionResult(
-                    success=False,
-                    output="Unknown monitoring command"
-                )
-        except Exception as e:
-            return ExecutionResult(
-                success=False,
-                output="",
-                error=f"Monitoring operation failed: {str(e)}"
-            )
+    def can_handle(self, command: Command) -> bool:
+        return any(keyword in command.raw_input for keyword in self.MONITORING_KEYWORDS)
     
     async def _show_metrics(self, command: Command) -> ExecutionResult:
         """Show service metrics"""
@@ -383,10 +490,11 @@ class MonitoringPlugin(BasePlugin):
             'request_rate': '1250 req/min'
         }
         
-        output = f"📊 Metrics for service '{service}':\n"
-        for key, value in metrics.items():
-            if key != 'service':
-                output += f"  • {key.replace('_', ' ').title()}: {value}\n"
+        output = f"📊 Metrics for service '{service}':\n" + "".join(
+            f"  • {key.replace('_', ' ').title()}: {value}\n"
+            for key, value in metrics.items()
+            if key != 'service'
+        )
         
         return ExecutionResult(
             success=True,
@@ -415,10 +523,11 @@ class MonitoringPlugin(BasePlugin):
                 output="✅ No active alerts found"
             )
         
-        output = "🚨 Active Alerts:\n"
-        for alert in alerts:
-            emoji = "🔴" if alert['severity'] == 'critical' else "🟡"
-            output += f"  {emoji} {alert['service']}: {alert['message']} ({alert['severity']})\n"
+        output = "🚨 Active Alerts:\n" + "".join(
+            f"  {'🔴' if alert['severity'] == 'critical' else '🟡'} "
+            f"{alert['service']}: {alert['message']} ({alert['severity']})\n"
+            for alert in alerts
+        )
         
         return ExecutionResult(
             success=True,
@@ -429,6 +538,26 @@ class MonitoringPlugin(BasePlugin):
 class SecurityPlugin(BasePlugin):
     """Security and compliance plugin"""
     
+    __slots__ = ("config",)
+    
+    SECURITY_KEYWORDS = ("scan", "vulnerability", "security", "compliance", "audit", "cve", "ports")
+    
+    intent_handlers = {
+        "vulnerability_scan": "_vulnerability_scan",
+        "port_scan": "_port_scan",
+        "compliance_audit": "_compliance_audit",
+        "cert_check": "_cert_check",
+    }
+    keyword_routes = (
+        (("vulnerability",), "vulnerability_scan"),
+        (("cve",), "vulnerability_scan"),
+        (("ports",), "port_scan"),
+        (("compliance",), "compliance_audit"),
+        (("certificate",), "cert_check"),
+    )
+    unknown_command_output = "Unknown security command"
+    error_prefix = "Security operation failed: "
+    
     def __init__(self, config_manager: ConfigManager):
         super().__init__("security", TaskCategory.SECURITY_COMPLIANCE)
         self.config = config_manager.config
@@ -440,32 +569,8 @@ class SecurityPlugin(BasePlugin):
         self.register_pattern(r"audit.*compliance", "compliance_audit")
         self.register_pattern(r"check.*certificates", "cert_check")
     
-    async def can_handle(self, command: Command) -> bool:
-        security_keywords = ["scan", "vulnerability", "security", "compliance", "audit", "cve", "ports"]
-        return any(keyword in command.raw_input.lower() for keyword in security_keywords)
-    
-    async def execute(self, command: Command) -> ExecutionResult:
-        """Execute security operations"""
-        try:
-            if "vulnerability" in command.raw_input.lower() or "cve" in command.raw_input.lower():
-                return await self._vulnerability_scan(command)
-            elif "ports" in command.raw_input.lower():
-                return await self._port_scan(command)
-            elif "compliance" in command.raw_input.lower():
-                return await self._compliance_audit(command)
-            elif "certificate" in command.raw_input.lower():
-                return await self._cert_check(command)
-            else:
-                return ExecutionResult(
-                    success=False,
-                    output="Unknown security command"
-                )
-        except Exception as e:
-            return ExecutionResult(
-                success=False,
-                output="",
-                error=f"Security operation failed: {str(e)}"
-            )
+    def can_handle(self, command: Command) -> bool:
+        return any(keyword in command.raw_input for keyword in self.SECURITY_KEYWORDS)
     
     async def _vulnerability_scan(self, command: Command) -> ExecutionResult:
         """Run vulnerability scan"""
@@ -484,17 +589,18 @@ class SecurityPlugin(BasePlugin):
             {'cve': 'CVE-2023-5678', 'severity': 'MEDIUM', 'package': 'curl', 'fixed_version': '8.0.1'}
         ]
         
-        output = f"🔍 Vulnerability Scan Results for {target}:\n"
-        critical_count = sum(1 for v in vulnerabilities if v['severity'] == 'CRITICAL')
-        high_count = sum(1 for v in vulnerabilities if v['severity'] == 'HIGH')
-        medium_count = sum(1 for v in vulnerabilities if v['severity'] == 'MEDIUM')
-        
-        output += f"  📊 Summary: {critical_count} Critical, {high_count} High, {medium_count} Medium\n\n"
+        severity_counts = Counter(v['severity'] for v in vulnerabilities)
         
+        parts = [
+            f"🔍 Vulnerability Scan Results for {target}:\n",
+            f"  📊 Summary: {severity_counts['CRITICAL']} Critical, {severity_counts['HIGH']} High, "
+            f"{severity_counts['MEDIUM']} Medium\n\n"
+        ]
         for vuln in vulnerabilities:
             emoji = "🔴" if vuln['severity'] == 'CRITICAL' else "🟡" if vuln['severity'] == 'HIGH' else "🟢"
-            output += f"  {emoji} {vuln['cve']} ({vuln['severity']})\n"
-            output += f"     Package: {vuln['package']}, Fix: {vuln['fixed_version']}\n"
+            parts.append(f"  {emoji} {vuln['cve']} ({vuln['severity']})\n")
+            parts.append(f"     Package: {vuln['package']}, Fix: {vuln['fixed_version']}\n")
+        output = "".join(parts)
         
         return ExecutionResult(
             success=True,
@@ -521,10 +627,11 @@ class SecurityPlugin(BasePlugin):
             {'port': 3000, 'service': 'Node.js', 'state': 'open'}
         ]
         
-        output = f"🔍 Port Scan Results for {target}:\n"
-        for port_info in open_ports:
-            status_emoji = "🟢" if port_info['state'] == 'open' else "🔴"
-            output += f"  {status_emoji} Port {port_info['port']}: {port_info['service']} ({port_info['state']})\n"
+        output = f"🔍 Port Scan Results for {target}:\n" + "".join(
+            f"  {'🟢' if port_info['state'] == 'open' else '🔴'} "
+            f"Port {port_info['port']}: {port_info['service']} ({port_info['state']})\n"
+            for port_info in open_ports
+        )
         
         return ExecutionResult(
             success=True,
@@ -535,6 +642,25 @@ class SecurityPlugin(BasePlugin):
 class CICDPlugin(BasePlugin):
     """CI/CD operations plugin"""
     
+    __slots__ = ("config",)
+    
+    CICD_KEYWORDS = ("pipeline", "deploy", "build", "rollback", "release", "jenkins", "github", "gitlab")
+    
+    intent_handlers = {
+        "trigger_pipeline": "_trigger_pipeline",
+        "rollback_deployment": "_rollback_deployment",
+        "deploy_service": "_deploy_service",
+        "build_status": "_build_status",
+    }
+    keyword_routes = (
+        (("trigger", "pipeline"), "trigger_pipeline"),
+        (("rollback",), "rollback_deployment"),
+        (("deploy",), "deploy_service"),
+        (("build", "status"), "build_status"),
+    )
+    unknown_command_output = "Unknown CI/CD command"
+    error_prefix = "CI/CD operation failed: "
+    
     def __init__(self, config_manager: ConfigManager):
         super().__init__("cicd", TaskCategory.CICD)
         self.config = config_manager.config
@@ -546,32 +672,8 @@ class CICDPlugin(BasePlugin):
         self.register_pattern(r"deploy.*(?P<service>\w+).*(?P<version>\w+)?", "deploy_service")
         self.register_pattern(r"build.*status.*(?P<pipeline>\w+)", "build_status")
     
-    async def can_handle(self, command: Command) -> bool:
-        cicd_keywords = ["pipeline", "deploy", "build", "rollback", "release", "jenkins", "github", "gitlab"]
-        return any(keyword in command.raw_input.lower() for keyword in cicd_keywords)
-    
-    async def execute(self, command: Command) -> ExecutionResult:
-        """Execute CI/CD operations"""
-        try:
-            if "trigger" in command.raw_input.lower() and "pipeline" in command.raw_input.lower():
-                return await self._trigger_pipeline(command)
-            elif "rollback" in command.raw_input.lower():
-                return await self._rollback_deployment(command)
-            elif "deploy" in command.raw_input.lower():
-                return await self._deploy_service(command)
-            elif "build" in command.raw_input.lower() and "status" in command.raw_input.lower():
-                return await self._build_status(command)
-            else:
-                return ExecutionResult(
-                    success=False,
-                    output="Unknown CI/CD command"
-                )
-        except Exception as e:
-            return ExecutionResult(
-                success=False,
-                output="",
-                error=f"CI/CD operation failed: {str(e)}"
-            )
+    def can_handle(self, command: Command) -> bool:
+        return any(keyword in command.raw_input for keyword in self.CICD_KEYWORDS)
     
     async def _trigger_pipeline(self, command: Command) -> ExecutionResult:
         """Trigger CI/CD pipeline"""
@@ -584,8 +686,8 @@ class CICDPlugin(BasePlugin):
                 command_executed=f"jenkins/github actions trigger: {pipeline}"
             )
         
-        # Mock pipeline trigger
-        build_id = f"#{hash(pipeline) % 1000}"
+        # Mock pipeline trigger (blake2b, unlike hash(), is stable across processes)
+        build_id = "#" + hashlib.blake2b(pipeline.encode(), digest_size=4).hexdigest()
         
         return ExecutionResult(
             success=True,
@@ -613,58 +715,57 @@ class CICDPlugin(BasePlugin):
             metadata={'service': service, 'previous_version': previous_version}
         )
 
+# Execution mode names accepted by ExtendedDevOpsGPT.process_command
+EXECUTION_MODES = {mode.value: mode for mode in ExecutionMode}
+
 # Extended DevOpsGPT with all plugins
 class ExtendedDevOpsGPT:
     """Extended DevOpsGPT with all plugin capabilities"""
     
-    def __init__(self, config_path: str = "devops_gpt_config.yaml"):
+    def __init__(self, config_path: str = "devops_gpt_config.yaml", config_manager: Optional[ConfigManager] = None):
         from devops_gpt_core import DevOpsGPT
         
-        self.config_manager = ConfigManager(config_path)
+        # Reuse an already-loaded configuration instead of re-reading the YAML file
+        self.config_manager = config_manager or get_config_manager(config_path)
         self.agent = DevOpsGPT()
         
         # Register all plugins
         self._register_plugins()
     
     def _register_plugins(self):
-        """Register all available plugins"""
-        # Cloud providers
-        try:
-            aws_plugin = AWSPlugin(self.config_manager)
-            self.agent.register_plugin(aws_plugin)
-        except Exception as e:
-            print(f"Warning: Could not initialize AWS plugin: {e}")
-        
-        # Kubernetes
-        try:
-            k8s_plugin = KubernetesPlugin(self.config_manager)
-            self.agent.register_plugin(k8s_plugin)
-        except Exception as e:
-            print(f"Warning: Could not initialize Kubernetes plugin: {e}")
-        
-        # Monitoring
-        monitoring_plugin = MonitoringPlugin(self.config_manager)
-        self.agent.register_plugin(monitoring_plugin)
-        
-        # Security
-        security_plugin = SecurityPlugin(self.config_manager)
-        self.agent.register_plugin(security_plugin)
-        
-        # CI/CD
-        cicd_plugin = CICDPlugin(self.config_manager)
-        self.agent.register_plugin(cicd_plugin)
+        """Register all available plugins
+        
+        Plugins are constructed concurrently, since AWS and Kubernetes setup is dominated
+        by blocking credential/config I/O, then registered in the order listed here.
+        """
+        # (name, factory, optional): optional plugins only warn if they fail to initialize
+        factories = (
+            ("AWS", AWSPlugin, True),
+            ("Kubernetes", KubernetesPlugin, True),
+            ("Monitoring", MonitoringPlugin, False),
+            ("Security", SecurityPlugin, False),
+            ("CI/CD", CICDPlugin, False),
+        )
+        with ThreadPoolExecutor(max_workers=len(factories)) as pool:
+            futures = [pool.submit(factory, self.config_manager) for _, factory, _ in factories]
+        
+        for (name, _, optional), future in zip(factories, futures):
+            try:
+                plugin = future.result()
+            except Exception as e:
+                if not optional:
+                    raise
+                print(f"Warning: Could not initialize {name} plugin: {e}")
+                continue
+            self.agent.register_plugin(plugin)
     
     async def process_command(self, user_input: str, execution_mode: str = "dry_run"):
         """Process command with extended plugin support"""
-        from devops_gpt_core import ExecutionMode
-        
-        mode_map = {
-            "dry_run": ExecutionMode.DRY_RUN,
-            "confirm": ExecutionMode.CONFIRM,
-            "execute": ExecutionMode.EXECUTE
-        }
-        
-        return await self.agent.process_command(user_input, mode_map.get(execution_mode, ExecutionMode.DRY_RUN))
+        return await self.agent.process_command(user_input, EXECUTION_MODES.get(execution_mode, ExecutionMode.DRY_RUN))
+    
+    async def process_commands(self, user_inputs: List[str], execution_mode: str = "dry_run"):
+        """Process several commands concurrently, returning results in input order"""
+        return await self.agent.process_commands(user_inputs, EXECUTION_MODES.get(execution_mode, ExecutionMode.DRY_RUN))
 
 # Example usage and testing
 async def demo_extended_devops_gpt():
@@ -688,12 +789,13 @@ async def demo_extended_devops_gpt():
         "rollback user-service"
     ]
     
-    for cmd in demo_commands:
+    # The commands hit independent backends, so run them together and report in order
+    results = await agent.process_commands(demo_commands, "dry_run")
+    
+    for cmd, result in zip(demo_commands, results):
         print(f"\n💬 Command: {cmd}")
         print("-" * 30)
         
-        result = await agent.process_command(cmd, "dry_run")
-        
         if result.success:
             print(f"✅ {result.output}")
         else:
@@ -702,5 +804,4 @@ async def demo_extended_devops_gpt():
         print()
 
 if __name__ == "__main__":
-    import asyncio
-    asyncio.run(demo_extended_devops_gpt())
\ No newline at end of file
+    run(demo_extended_devops_gpt())
\ No newline at end of file